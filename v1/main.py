@@ -2,8 +2,18 @@ import pygame
 import sys
 import math
 import random
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 def load_image(filename, size = None, flip = None):
+    """Load an image converted to the display format, keeping per-pixel alpha"""
     try:
         image = pygame.image.load(filename).convert_alpha()
         if size:
@@ -14,7 +24,7 @@ def load_image(filename, size = None, flip = None):
     except (pygame.error, FileNotFoundError):
         print(f"Could not load image: {filename}")
         # Create a placeholder colored rectangle if image fails to load
-        placeholder = pygame.Surface((64, 64))
+        placeholder = pygame.Surface((64, 64)).convert()
         placeholder.fill(RED if "face1" in filename else GREEN)
         return placeholder
     
@@ -29,18 +39,42 @@ def preload_heart_images():
         # Pre-scale to common sizes used by particles
         sizes = [20, 25, 30, 35, 40, 45]
         for size in sizes:
-            HEART_CACHE[size] = pygame.transform.scale(heart, (size, size))
+            HEART_CACHE[size] = pygame.transform.scale(heart, (size, size)).convert_alpha()
+            bake_faded_hearts(size)
             
     except (pygame.error, FileNotFoundError):
         print("Could not load heart image, using rectangles instead")
         # Fallback to colored rectangles
         for size in [20, 25, 30, 35, 40, 45]:
-            heart_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            heart_surface.fill((255, 182, 203, 255))  # Pink rectangle
+            heart_surface = pygame.Surface((size, size)).convert()  # Opaque, no alpha needed
+            heart_surface.fill((255, 182, 203))  # Pink rectangle
             HEART_CACHE[size] = heart_surface
+            bake_faded_hearts(size)
+
+def bake_faded_hearts(size):
+    """Pre-bake FADE_LEVELS alpha steps of the cached heart at this size
+
+    Surfaces are stored premultiplied so they can be drawn with
+    BLEND_PREMULTIPLIED, SDL's fastest per-pixel alpha blitter.
+    """
+    base = HEART_CACHE[size].convert_alpha().premul_alpha()
+    levels = []
+    for level in range(FADE_LEVELS):
+        alpha = 32 * level + 31
+        faded = base.copy()
+        faded.fill((alpha, alpha, alpha, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        levels.append(faded)
+    HEART_FADED[size] = levels
 
 def get_cached_heart(size):
-    """Get a cached heart image of the specified size"""
+    """Get a cached heart image of the specified size (memoized per size)"""
+    heart = HEART_SIZE_LUT[size]
+    if heart is None:
+        heart = HEART_SIZE_LUT[size] = find_cached_heart(size)
+    return heart
+
+def find_cached_heart(size):
+    """Find the cached heart image closest to the specified size"""
     # Find the closest cached size
     available_sizes = list(HEART_CACHE.keys())
     if not available_sizes:
@@ -58,59 +92,97 @@ def get_cached_heart(size):
     
     # For larger differences, scale the closest one (but cache it for future use)
     if size not in HEART_CACHE:
-        HEART_CACHE[size] = pygame.transform.scale(HEART_CACHE[closest_size], (size, size))
+        HEART_CACHE[size] = pygame.transform.scale(HEART_CACHE[closest_size], (size, size)).convert_alpha()
+        bake_faded_hearts(size)
     
     return HEART_CACHE[size]
+
+def get_faded_hearts(size):
+    """Get the pre-faded versions of the cached heart closest to size"""
+    faded = FADED_SIZE_LUT[size]
+    if faded is None:
+        heart = get_cached_heart(size)
+        if heart is None:
+            return None
+        faded = FADED_SIZE_LUT[size] = HEART_FADED[heart.get_width()]
+    return faded
     
+class AnimState:
+    """Animation state for one face, slotted for fast attribute access"""
+    __slots__ = ('is_animating', 'start_time', 'duration', 'start_scale', 'target_scale',
+                 'bounce_height', 'bounce_amp', 'flipped', 'text')
+
+    def __init__(self):
+        self.is_animating = False
+        self.start_time = 0
+        self.duration = 600  # ms
+        self.start_scale = 1.0
+        self.target_scale = 1.0
+        self.bounce_height = 0
+        self.bounce_amp = 50  # px
+        self.flipped = False
+        self.text = None
+
+class Timers:
+    """Frame counters for held keys"""
+    __slots__ = ('space', 'p', 'kg')
+
+    def __init__(self):
+        self.space = 0
+        self.p = 0
+        self.kg = 0
+
 def start_flip_animation(face_anim, current_time, text = None):
     """Start a bounce animation for flipping"""
-    if not face_anim['is_animating']:
-        face_anim['is_animating'] = True
-        face_anim['start_time'] = current_time
-        face_anim['start_scale'] = 1.0
-        face_anim['target_scale'] = 1.2  # Slightly larger during bounce
-        face_anim['bounce_height'] = 0
-        face_anim['bounce_amp'] = 50  # px
-        face_anim['flipped'] = not face_anim['flipped']
-        face_anim['text'] = text
+    if not face_anim.is_animating:
+        face_anim.is_animating = True
+        face_anim.start_time = current_time
+        face_anim.start_scale = 1.0
+        face_anim.target_scale = 1.2  # Slightly larger during bounce
+        face_anim.bounce_height = 0
+        face_anim.bounce_amp = 50  # px
+        face_anim.flipped = not face_anim.flipped
+        face_anim.text = text
 
 def update_animation(face_anim, current_time):
     """Update animation state and return scale factor and vertical offset"""
-    if not face_anim['is_animating']:
+    if not face_anim.is_animating:
         return 1.0, 0
     
-    elapsed = current_time - face_anim['start_time']
-    progress = min(elapsed / face_anim['duration'], 1.0)
+    elapsed = current_time - face_anim.start_time
+    progress = min(elapsed / face_anim.duration, 1.0)
     
     if progress >= 1.0:
-        face_anim['is_animating'] = False
+        face_anim.is_animating = False
         return 1.0, 0
     
-    # Use bounce easing for scale
-    bounce_progress = easeOutBounce(progress)
-    scale = 1.0 + (face_anim['target_scale'] - 1.0) * (1.0 - bounce_progress)
-    
-    # Add vertical bounce using sine wave for more natural movement
-    bounce_height = math.sin(progress * math.pi) * face_anim['bounce_amp']  # Max x pixels up
+    # Bounce easing for scale and a sine arc for the vertical bounce, from one lookup
+    bounce_progress, bounce_arc = bounce_curve(progress)
+    scale = 1.0 + (face_anim.target_scale - 1.0) * (1.0 - bounce_progress)
+    bounce_height = bounce_arc * face_anim.bounce_amp  # Max x pixels up
     
     return scale, -bounce_height
 
-def apply_animation_transform(original_img, scale, vertical_offset, is_flipped):
-    """Apply scale and position transformations to image"""
-    # Apply flip if needed
-    img = original_img
-    if is_flipped:
-        img = pygame.transform.flip(img, True, False)
-    
-    # Apply scale
-    if scale != 1.0:
-        new_width = int(img.get_width() * scale)
-        new_height = int(img.get_height() * scale)
-        img = pygame.transform.scale(img, (new_width, new_height))
-    
-    return img, vertical_offset
-
-def easeOutBounce(t):
+def build_scale_ladder(original_img):
+    """Pre-scale an image for every animation scale step, flipped and not"""
+    ladder = {}
+    for is_flipped in (False, True):
+        img = pygame.transform.flip(original_img, True, False) if is_flipped else original_img
+        steps = [img]
+        for i in range(1, SCALE_STEPS):
+            scale = 1.0 + i * SCALE_STEP
+            new_width = int(img.get_width() * scale)
+            new_height = int(img.get_height() * scale)
+            steps.append(pygame.transform.scale(img, (new_width, new_height)))
+        ladder[is_flipped] = steps
+    return ladder
+
+def apply_animation_transform(scale_ladder, scale, vertical_offset, is_flipped):
+    """Pick the pre-scaled image closest to the animation scale"""
+    step = min(SCALE_STEPS - 1, max(0, int(round((scale - 1.0) / SCALE_STEP))))
+    return scale_ladder[is_flipped][step], vertical_offset
+
+def easeOutBounceExact(t):
     """Bounce easing function for smooth bounce animation"""
     if t < 1/2.75:
         return 7.5625 * t * t
@@ -124,7 +196,7 @@ def easeOutBounce(t):
         t -= 2.625/2.75
         return 7.5625 * t * t + 0.984375
 
-def easeOutElastic(t):
+def easeOutElasticExact(t):
     """Elastic easing function for a more playful bounce"""
     if t == 0:
         return 0
@@ -134,76 +206,148 @@ def easeOutElastic(t):
     s = p / 4
     return (2 ** (-10 * t)) * math.sin((t - s) * (2 * math.pi) / p) + 1
 
-class BaseParticle:
-    """Base class for all particles with common physics"""
-    def __init__(self, x, y, v_x, v_y, color, size, life_time):
-        self.x = x
-        self.y = y
-        self.v_x = v_x
-        self.v_y = v_y
-        self.color = color
-        self.current_color = color
-        self.size = size
-        self.life_time = life_time
-        self.max_life = life_time
-        self.gravity = 0.1
+# Easing curves sampled once at import, t in [0, 1] maps to an index
+EASE_LUT_SIZE = 1024
+BOUNCE_LUT = [easeOutBounceExact(i / (EASE_LUT_SIZE - 1)) for i in range(EASE_LUT_SIZE)]
+ELASTIC_LUT = [easeOutElasticExact(i / (EASE_LUT_SIZE - 1)) for i in range(EASE_LUT_SIZE)]
+BOUNCE_ARC_LUT = [math.sin(math.pi * i / (EASE_LUT_SIZE - 1)) for i in range(EASE_LUT_SIZE)]
 
-    def update(self):
-        """Update particle physics and lifetime"""
-        self.x += self.v_x
-        self.y += self.v_y
-        self.v_y += self.gravity  # Apply gravity
-        self.v_x *= 0.99  # Air resistance
-
-        # Decrease life time
-        self.life_time -= 1
-
-        # Fade color based on remaining life
-        alpha = self.life_time / self.max_life
-        self.current_color = (
-            int(self.color[0] * alpha),
-            int(self.color[1] * alpha),
-            int(self.color[2] * alpha)
-        )
+def easeOutBounce(t):
+    """Bounce easing looked up from the precomputed table"""
+    return BOUNCE_LUT[int(t * (EASE_LUT_SIZE - 1))]
 
-        return self.life_time > 0
-    
-    def draw(self, screen):
-        """Override in subclasses"""
-        pass
+def easeOutElastic(t):
+    """Elastic easing looked up from the precomputed table"""
+    return ELASTIC_LUT[int(t * (EASE_LUT_SIZE - 1))]
+
+def bounce_curve(t):
+    """Bounce easing and sine arc (0 -> 1 -> 0) for t, sharing one table index"""
+    i = int(t * (EASE_LUT_SIZE - 1))
+    return BOUNCE_LUT[i], BOUNCE_ARC_LUT[i]
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def step_particles(x, y, vx, vy, life, max_life, r, g, b, size, kind, n, gravity):
+    """Update n particles in place and return the new live count (swap-and-pop)"""
+    i = 0
+    while i < n:
+        x[i] += vx[i]
+        y[i] += vy[i]
+        vy[i] += gravity  # Apply gravity
+        vx[i] *= 0.99  # Air resistance
+        life[i] -= 1
+
+        if life[i] > 0:
+            i += 1
+        else:
+            # Move the last (not yet updated) particle into the dead slot
+            n -= 1
+            x[i] = x[n]
+            y[i] = y[n]
+            vx[i] = vx[n]
+            vy[i] = vy[n]
+            life[i] = life[n]
+            max_life[i] = max_life[n]
+            r[i] = r[n]
+            g[i] = g[n]
+            b[i] = b[n]
+            size[i] = size[n]
+            kind[i] = kind[n]
+    return n
+
+HEART, PIXEL = 0, 1  # Particle kinds stored in ParticleSystem.kind
+PARTICLE_CAPACITY = 2048  # Live particles shared by all explosions
+
+class ParticleSystem:
+    """Structure-of-arrays particle storage with vectorized physics"""
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.vx = np.empty(capacity, dtype=np.float32)
+        self.vy = np.empty(capacity, dtype=np.float32)
+        self.r = np.empty(capacity, dtype=np.float32)
+        self.g = np.empty(capacity, dtype=np.float32)
+        self.b = np.empty(capacity, dtype=np.float32)
+        self.life = np.empty(capacity, dtype=np.float32)
+        self.max_life = np.empty(capacity, dtype=np.float32)
+        self.size = np.empty(capacity, dtype=np.int32)
+        self.kind = np.empty(capacity, dtype=np.int8)
+        self.n_active = 0
+        self.gravity = 0.1
+        self.rng = np.random.default_rng()  # Batched RNG for explosions
+
+    def spawn_batch(self, x, y, v_x, v_y, colors, sizes, life_times, kind):
+        """Append particles sharing a spawn point, dropping any beyond capacity"""
+        start = self.n_active
+        end = min(self.capacity, start + len(sizes))
+        count = end - start
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = v_x[:count]
+        self.vy[start:end] = v_y[:count]
+        self.r[start:end] = colors[:count, 0]
+        self.g[start:end] = colors[:count, 1]
+        self.b[start:end] = colors[:count, 2]
+        self.life[start:end] = life_times[:count]
+        self.max_life[start:end] = life_times[:count]
+        self.size[start:end] = sizes[:count]
+        self.kind[start:end] = kind
+        self.n_active = end
+
+    def update_all(self):
+        """Update physics and lifetime of every live particle in one kernel call"""
+        self.n_active = step_particles(
+            self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+            self.r, self.g, self.b, self.size, self.kind, self.n_active, self.gravity
+        )
+        return self.n_active > 0
 
-class PixelParticle(BaseParticle):
-    """Simple pixel-art style rectangular particles"""
-    def __init__(self, x, y, v_x, v_y, color, size, life_time):
-        super().__init__(x, y, v_x, v_y, color, size, life_time)
-    
     def draw(self, screen):
-        if self.life_time > 0:
-            # Draw particle as a small square for pixel art style
-            particle_rect = pygame.Rect(int(self.x), int(self.y), self.size, self.size)
-            pygame.draw.rect(screen, self.current_color, particle_rect)
-
-class HeartParticle(BaseParticle):
-    """Heart-shaped particles using cached heart images"""
-    def __init__(self, x, y, v_x, v_y, color, size, life_time):
-        super().__init__(x, y, v_x, v_y, color, size, life_time)
-        self.heart_image = get_cached_heart(size)
-        self.alpha_step = 255.0 / life_time
-    
-    def draw(self, screen):
-        if self.life_time > 0 and self.heart_image:
-            # Calculate alpha for fading effect
-            alpha = int(255 * (self.life_time / self.max_life))
-            
-            # Only set alpha if it changed significantly (avoid unnecessary operations)
-            if alpha < 255:
-                # Create a copy with alpha for this frame
-                faded_heart = self.heart_image.copy()
-                faded_heart.set_alpha(alpha)
-                screen.blit(faded_heart, (int(self.x), int(self.y)))
-            else:
-                # No fading needed, blit directly
-                screen.blit(self.heart_image, (int(self.x), int(self.y)))
+        """Draw all live particles"""
+        n = self.n_active
+        is_pixel = self.kind[:n] == PIXEL
+        if is_pixel.any():
+            self.draw_pixels(screen, np.nonzero(is_pixel)[0])
+
+        hearts = np.nonzero(~is_pixel)[0]
+        xs = self.x[hearts].astype(np.int32).tolist()
+        ys = self.y[hearts].astype(np.int32).tolist()
+        sizes = self.size[hearts].tolist()
+        # Pick the pre-baked fade level closest to the remaining life
+        levels = np.minimum(FADE_LEVELS - 1,
+                            (FADE_LEVELS * self.life[hearts] / self.max_life[hearts]).astype(np.int32)).tolist()
+
+        # Collect hearts into one blit sequence so the loop runs in C
+        blit_list = []
+        for i in range(len(sizes)):
+            faded_hearts = get_faded_hearts(sizes[i])
+            if faded_hearts:
+                blit_list.append((faded_hearts[levels[i]], (xs[i], ys[i]),
+                                  None, pygame.BLEND_PREMULTIPLIED))
+
+        if blit_list:
+            screen.blits(blit_list, doreturn=False)
+
+    def draw_pixels(self, screen, indices):
+        """Fill each pixel particle's square in particle order, so later particles win overlaps"""
+        xs = self.x[indices].astype(np.int32).tolist()
+        ys = self.y[indices].astype(np.int32).tolist()
+        sizes = self.size[indices].tolist()
+        # Fade color based on remaining life, only for the particles drawn here
+        alpha = self.life[indices] / self.max_life[indices]
+        colors = (np.stack((self.r[indices], self.g[indices], self.b[indices]), axis=1)
+                  * alpha[:, None]).astype(np.uint8).tolist()
+
+        # Plain fill is the cheapest way to draw a small square
+        fill = screen.fill
+        for i in range(len(sizes)):
+            fill(colors[i], (xs[i], ys[i], sizes[i], sizes[i]))
+
+# Unit vectors for explosion directions, indexed by a random 10-bit number
+DIRECTION_BITS = 10
+DIRECTION_ANGLES = np.linspace(0, 2 * math.pi, 1 << DIRECTION_BITS, endpoint=False)
+DIR_X = np.cos(DIRECTION_ANGLES).astype(np.float32)
+DIR_Y = np.sin(DIRECTION_ANGLES).astype(np.float32)
 
 class Firework:
     def __init__(self, x, y, target_x, target_y, color, particle_type="heart"):
@@ -216,85 +360,73 @@ class Firework:
         self.v_x = (target_x - x) * 0.02
         self.v_y = (target_y - y) * 0.02
         self.exploded = False
-        self.particles = []
 
     def update(self):
-        if not self.exploded:
-            # Move towards target
-            self.x += self.v_x
-            self.y += self.v_y
-
-            # Check if reached target (with some tolerance)
-            if abs(self.x - self.target_x) < 10 and abs(self.y - self.target_y) < 10:
-                self.explode()
-        else:
-            # Update explosion particles
-            self.particles = [p for p in self.particles if p.update()]
+        # Move towards target
+        self.x += self.v_x
+        self.y += self.v_y
+
+        # Check if reached target (with some tolerance)
+        if abs(self.x - self.target_x) < 10 and abs(self.y - self.target_y) < 10:
+            self.explode()
 
-        return len(self.particles) > 0 or not self.exploded
+        # Once exploded the particles live on in particle_system
+        return not self.exploded
     
     def explode(self):
         self.exploded = True
-        # Create explosion particles in all directions
-        particle_count = random.randint(5, 15)  # 15, 25
-
-        for _ in range(particle_count):
-            # Random direction and speed
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            v_x = math.cos(angle) * speed
-            v_y = math.sin(angle) * speed
-
-            # Vary particle properties based on type
-            if self.particle_type == "heart":
-                size = random.randint(25, 40)
-                life_time = random.randint(30, 60)
-            else:  # pixel particles
-                size = random.randint(2, 6)
-                life_time = random.randint(20, 40)
-            
-            # Color variations
-            color_variant = (
-                min(255, max(0, self.color[0] + random.randint(-30, 30))),
-                min(255, max(0, self.color[1] + random.randint(-30, 30))),
-                min(255, max(0, self.color[2] + random.randint(-30, 30)))
-            )
-
-            # Create the appropriate particle type
-            if self.particle_type == "heart":
-                particle = HeartParticle(self.x, self.y, v_x, v_y, color_variant, size, life_time)
-            else:
-                particle = PixelParticle(self.x, self.y, v_x, v_y, color_variant, size, life_time)
-            
-            self.particles.append(particle)
+        rng = particle_system.rng
+        # Create all explosion particles in one vectorized batch
+        particle_count = int(rng.integers(5, 16))
+
+        # Random direction (from the unit vector table) and speed
+        directions = rng.integers(0, 1 << DIRECTION_BITS, particle_count)
+        speeds = rng.uniform(2, 8, particle_count)
+        v_x = DIR_X[directions] * speeds
+        v_y = DIR_Y[directions] * speeds
+
+        # Vary particle properties based on type
+        if self.particle_type == "heart":
+            kind = HEART
+            sizes = rng.integers(25, 41, particle_count)
+            life_times = rng.integers(30, 61, particle_count)
+        else:  # pixel particles
+            kind = PIXEL
+            sizes = rng.integers(2, 7, particle_count)
+            life_times = rng.integers(20, 41, particle_count)
+
+        # Color variations
+        colors = np.clip(np.array(self.color) + rng.integers(-30, 31, (particle_count, 3)), 0, 255)
+
+        particle_system.spawn_batch(self.x, self.y, v_x, v_y, colors, sizes, life_times, kind)
 
     def draw(self, screen):
-        if not self.exploded:
-            # Draw the ascending firework
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 3)
-            # Draw trail
-            for i in range(5):
-                trail_x = int(self.x - self.v_x * i * 2)
-                trail_y = int(self.y - self.v_y * i * 2)
-                alpha = 1 - (i * 0.2)
-                trail_color = (
-                    int(self.color[0] * alpha),
-                    int(self.color[1] * alpha),
-                    int(self.color[2] * alpha)
-                )
-                pygame.draw.circle(screen, trail_color, (int(trail_x), int(trail_y)), max(1, 3 - i))
-        else:
-            # Draw explosion particles
-            for particle in self.particles:
-                particle.draw(screen)
+        # Draw the ascending firework
+        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 3)
+        # Draw trail
+        for i in range(5):
+            trail_x = int(self.x - self.v_x * i * 2)
+            trail_y = int(self.y - self.v_y * i * 2)
+            alpha = 1 - (i * 0.2)
+            trail_color = (
+                int(self.color[0] * alpha),
+                int(self.color[1] * alpha),
+                int(self.color[2] * alpha)
+            )
+            pygame.draw.circle(screen, trail_color, (int(trail_x), int(trail_y)), max(1, 3 - i))
+
+# Dedicated generator with pre-bound methods for firework launches
+firework_rng = random.Random()
+randint = firework_rng.randint
+choice = firework_rng.choice
 
 def create_firework(particle_type="heart"):
     """Create a new firework at random position with specified particle type"""
-    start_x = random.randint(50, WIDTH - 50)
+    start_x = randint(50, WIDTH - 50)
     start_y = HEIGHT
-    target_x = random.randint(100, WIDTH - 100)
-    target_y = random.randint(50, HEIGHT // 2)
-    color = random.choice(firework_colors)
+    target_x = randint(100, WIDTH - 100)
+    target_y = randint(50, HEIGHT // 2)
+    color = choice(firework_colors)
 
     return Firework(start_x, start_y, target_x, target_y, color, particle_type)
 
@@ -325,6 +457,10 @@ WIDTH, HEIGHT = 800, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Pygame Starter Setup")
 
+# Drop every event except QUIT at the SDL level (key state is still tracked)
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT])
+
 # Set up clock
 clock = pygame.time.Clock()
 FPS = 60
@@ -332,105 +468,131 @@ FPS = 60
 src_face1_img = load_image('first_pygame/derp.png',(64,64), True)
 src_face2_img = load_image('first_pygame/derp.png',(64,64))
 
-face1_img = src_face1_img.copy()
-face2_img = src_face2_img.copy()
+# Scale steps cover the bounce animation range 1.0 - 1.2
+SCALE_STEP = 0.02
+SCALE_STEPS = 11
+face1_scaled = build_scale_ladder(src_face1_img)
+face2_scaled = build_scale_ladder(src_face2_img)
+
+face1_img = src_face1_img
+face2_img = src_face2_img
 
 face1_pos = [100, HEIGHT // 2 - 32]
 face2_pos = [WIDTH - 164, HEIGHT // 2 - 32]
 
+# Fonts and static text are created once instead of every frame
+font24 = pygame.font.Font(None, 24)
+font36 = pygame.font.Font(None, 36)
+kwimi_text = font24.render("Grogu is so cutie", True, WHITE)
+grogu_text = font24.render("Kwomiiiii", True, WHITE)
+label1 = font36.render("Kwimi", True, WHITE)
+label2 = font36.render("Grogu", True, WHITE)
+
+INSTRUCTIONS = [
+    "SPACE: Heart fireworks",
+    "P: Pixel fireworks",
+    "K+G: Romance combo (hearts!)"
+]
+instruction_blits = [
+    (font24.render(instruction, True, WHITE), (10, 10 + i * 25))
+    for i, instruction in enumerate(INSTRUCTIONS)
+]
+
 HEART_CACHE = {}
+HEART_FADED = {}  # size -> heart surfaces with increasing alpha
+FADE_LEVELS = 8
+# Direct size -> surface tables, filled in on first lookup of each size
+HEART_SIZE_LUT = [None] * 256
+FADED_SIZE_LUT = [None] * 256
 # Pre-load heart images for performance
 preload_heart_images()
 
-face1_anim = {
-    'is_animating': False,
-    'start_time': 0,
-    'duration': 600,  # ms
-    'start_scale': 1.0,
-    'target_scale': 1.0,
-    'bounce_height': 0,
-    'flipped': False
-}
-
-face2_anim = {
-    'is_animating': False,
-    'start_time': 0,
-    'duration': 600,  # ms
-    'start_scale': 1.0,
-    'target_scale': 1.0,
-    'bounce_height': 0,
-    'flipped': False
-}
+# One pre-allocated particle store shared by every explosion
+particle_system = ParticleSystem()
+
+face1_anim = AnimState()
+face2_anim = AnimState()
 
 # Main loop
 running = True
-space_timer = 0
-p_timer = 0
-kg_timer = 0
+timers = Timers()
 
 while running:
     current_time = pygame.time.get_ticks()
     screen.fill((30, 30, 30))  # Fill the screen with a dark color
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+    # Only QUIT reaches the queue, so there is nothing else to iterate
+    if pygame.event.peek(pygame.QUIT):
+        running = False
+    pygame.event.clear()
 
     # Check for continuous key presses for animations
     keys = pygame.key.get_pressed()
+    # Read each key once per frame
+    key_space = keys[pygame.K_SPACE]
+    key_p = keys[pygame.K_p]
+    key_k = keys[pygame.K_k]
+    key_g = keys[pygame.K_g]
+    key_left = keys[pygame.K_LEFT]
+    key_right = keys[pygame.K_RIGHT]
 
     # Firework controls
-    if keys[pygame.K_SPACE]:
+    if key_space:
         # Space = Heart fireworks
-        space_timer += 1
-        if space_timer % 8 == 0:  # Every 8 frames
+        timers.space += 1
+        if timers.space % 8 == 0:  # Every 8 frames
             fireworks.append(create_firework("heart"))
     else:
-        space_timer = 0
+        timers.space = 0
 
-    if keys[pygame.K_p] and not keys[pygame.K_k]:
+    if key_p and not key_k:
         # P = Pixel fireworks
-        p_timer += 1
-        if p_timer % 8 == 0:  # Every 8 frames
+        timers.p += 1
+        if timers.p % 8 == 0:  # Every 8 frames
             fireworks.append(create_firework("pixel"))
     else:
-        p_timer = 0
+        timers.p = 0
 
     # Handle LEFT key for face1 animation
-    if keys[pygame.K_LEFT]:
-        if not face1_anim['is_animating']:
+    if key_left:
+        if not face1_anim.is_animating:
             # Start new animation
             start_flip_animation(face1_anim, current_time)
 
     # Handle RIGHT key for face2 animation
-    if keys[pygame.K_RIGHT]:
-        if not face2_anim['is_animating']:
+    if key_right:
+        if not face2_anim.is_animating:
             # Start new animation
             start_flip_animation(face2_anim, current_time)
 
     # Handle K key for face1 animation with text
-    if keys[pygame.K_k]:
-        if not face1_anim['is_animating']:
-            font = pygame.font.Font(None, 24)
-            text = font.render("Grogu is so cutie", True, WHITE)
-            start_flip_animation(face1_anim, current_time, text)
+    if key_k:
+        if not face1_anim.is_animating:
+            start_flip_animation(face1_anim, current_time, kwimi_text)
     # Handle G key for face2 with text
-    if keys[pygame.K_g]:
-        if not face2_anim['is_animating']:
-            font = pygame.font.Font(None, 24)
-            text = font.render("Kwomiiiii", True, WHITE)
-            start_flip_animation(face2_anim, current_time, text)
+    if key_g:
+        if not face2_anim.is_animating:
+            start_flip_animation(face2_anim, current_time, grogu_text)
 
     # Trigger multiple fireworks during the combo (heart fireworks for romance!)
-    if keys[pygame.K_k] and keys[pygame.K_g]:
-        kg_timer += 1
-        if kg_timer % 4 == 0:  # Every 4 frames
+    if key_k and key_g:
+        timers.kg += 1
+        if timers.kg % 4 == 0:  # Every 4 frames
             fireworks.append(create_firework("heart"))
     else:
-        kg_timer = 0
+        timers.kg = 0
+
+    # Update all explosion particles in a single pass, before new bursts
+    # spawn, so a burst is drawn at its spawn position on its first frame
+    particle_system.update_all()
 
-    # Update fireworks
-    fireworks = [fw for fw in fireworks if fw.update()]
+    # Update fireworks, compacting the list in place
+    write = 0
+    for firework in fireworks:
+        if firework.update():
+            fireworks[write] = firework
+            write += 1
+    del fireworks[write:]
 
     # Update animations
     face1_scale, face1_bounce = update_animation(face1_anim, current_time)
@@ -438,10 +600,10 @@ while running:
 
     # Apply transformations
     face1_img, face1_y_offset = apply_animation_transform(
-        src_face1_img, face1_scale, face1_bounce, face1_anim['flipped']
+        face1_scaled, face1_scale, face1_bounce, face1_anim.flipped
     )
     face2_img, face2_y_offset = apply_animation_transform(
-        src_face2_img, face2_scale, face2_bounce, face2_anim['flipped']
+        face2_scaled, face2_scale, face2_bounce, face2_anim.flipped
     )
 
     pygame.draw.line(screen, WHITE, [0, HEIGHT // 2 + 32], [WIDTH, HEIGHT // 2 + 32], 10)
@@ -460,40 +622,28 @@ while running:
     screen.blit(face1_img, face1_draw_pos)
     screen.blit(face2_img, face2_draw_pos)
 
-    # Draw fireworks
+    # Draw fireworks and all explosion particles
     for firework in fireworks:
         firework.draw(screen)
+    particle_system.draw(screen)
 
     # Draw labels for the faces
-    font = pygame.font.Font(None, 36)
-    label1 = font.render("Kwimi", True, WHITE)
-    label2 = font.render("Grogu", True, WHITE)
-
     screen.blit(label1, (face1_pos[0], face1_draw_pos[1] - 40))
     screen.blit(label2, (face2_pos[0], face2_draw_pos[1] - 40))
 
     # Draw animated text if available
-    if face1_anim.get('text') and face1_anim['is_animating']:
+    if face1_anim.text and face1_anim.is_animating:
         # Position text above the bouncing image
         text_pos = (face1_draw_pos[0] + 80, face1_draw_pos[1])
-        screen.blit(face1_anim['text'], text_pos)
+        screen.blit(face1_anim.text, text_pos)
     
-    if face2_anim.get('text') and face2_anim['is_animating']:
+    if face2_anim.text and face2_anim.is_animating:
         # Position text above the bouncing image
         text_pos = (face2_draw_pos[0] - 80, face2_draw_pos[1])
-        screen.blit(face2_anim['text'], text_pos)
+        screen.blit(face2_anim.text, text_pos)
 
     # Draw firework instructions
-    instruction_font = pygame.font.Font(None, 24)
-    instructions = [
-        "SPACE: Heart fireworks",
-        "P: Pixel fireworks", 
-        "K+G: Romance combo (hearts!)"
-    ]
-    
-    for i, instruction in enumerate(instructions):
-        instruction_surface = instruction_font.render(instruction, True, WHITE)
-        screen.blit(instruction_surface, (10, 10 + i * 25))
+    screen.blits(instruction_blits, doreturn=False)
 
     pygame.display.flip()
     clock.tick(FPS)
@@ -8,7 +8,7 @@ particle effects, character animations, and clean code practices.
 Main Components:
     Game: Main game controller
     Character: Animated character system
-    Firework: Particle-based firework effects
+    Firework: Firework rockets bursting into particles
     ParticleCache: Performance-optimized sprite caching
 
 Quick Start:
@@ -25,9 +25,7 @@ __all__ = [
     'Character', 
     'Firework',
     'ParticleCache',
-    'BaseParticle',
-    'PixelParticle',
-    'HeartParticle',
+    'ParticleSystem',
     'InputHandler',
     'Renderer',
     'FireworkManager'
@@ -36,13 +34,7 @@ __all__ = [
 # Make key classes available at package level
 from .main import Game
 from .character import Character
-from .particles import (
-    Firework, 
-    ParticleCache,
-    BaseParticle,
-    PixelParticle,
-    HeartParticle
-)
+from .particles import Firework, ParticleCache, ParticleSystem
 from .input_handler import InputHandler
 from .renderer import Renderer
 from .firework_manager import FireworkManager
\ No newline at end of file
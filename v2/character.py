@@ -7,6 +7,7 @@ flipping, and text bubble support. Uses easing functions for natural-looking
 motion.
 
 Classes:
+    AnimationState: Slotted container for a character's animation state
     Character: Fully animated character with image loading, transformations,
                and text overlay capabilities
 
@@ -21,6 +22,60 @@ import math
 from config import ANIMATION_DURATION, BOUNCE_AMPLITUDE, WHITE
 from utils import ease_out_bounce
 
+# Number of discrete scale steps between 1.0 and target_scale that get cached
+SCALE_BUCKETS = 16
+
+# Placeholder surfaces by size, shared when several characters fail to load
+_placeholder_cache = {}
+
+# Name-label font shared by all characters, created on first use
+_label_font = None
+
+
+def _get_label_font():
+    """Return the shared 36px label font (pygame must be initialized)."""
+    global _label_font
+    if _label_font is None:
+        _label_font = pygame.font.Font(None, 36)
+    return _label_font
+
+
+def _center_offset(size):
+    """Return the (x, y) offset that centers a surface of this size on a 64x64 slot."""
+    return (-((size[0] - 64) // 2), -((size[1] - 64) // 2))
+
+
+class AnimationState:
+    """
+    Animation state for one character.
+    
+    Uses __slots__ so the per-frame reads in Character and InputHandler are
+    plain attribute loads rather than dict lookups.
+    
+    Attributes:
+        is_animating (bool): Whether animation is active
+        start_time (int): Animation start time in milliseconds
+        duration (int): Total animation duration in milliseconds
+        start_scale, target_scale (float): Scale transformation bounds
+        bounce_height (float): Current vertical bounce offset
+        bounce_amp (int): Maximum bounce height in pixels
+        flipped (bool): Whether image is currently flipped
+        text (pygame.Surface): Optional text to display during animation
+    """
+    __slots__ = ('is_animating', 'start_time', 'duration', 'start_scale', 'target_scale',
+                 'bounce_height', 'bounce_amp', 'flipped', 'text')
+
+    def __init__(self):
+        self.is_animating = False
+        self.start_time = 0
+        self.duration = ANIMATION_DURATION
+        self.start_scale = 1.0
+        self.target_scale = 1.2  # 20% larger at peak
+        self.bounce_height = 0
+        self.bounce_amp = BOUNCE_AMPLITUDE
+        self.flipped = False
+        self.text = None  # Optional text surface to display
+
 
 class Character:
     """
@@ -36,17 +91,7 @@ class Character:
         src_image (pygame.Surface): Original character image (never modified)
         current_image (pygame.Surface): Currently displayed image (may be transformed)
         current_bounce (float): Current vertical offset from bounce animation
-        animation (dict): Animation state including timing, scale, flip, and text
-    
-    Animation State Keys:
-        is_animating (bool): Whether animation is active
-        start_time (int): Animation start time in milliseconds
-        duration (int): Total animation duration in milliseconds
-        start_scale, target_scale (float): Scale transformation bounds
-        bounce_height (float): Current vertical bounce offset
-        bounce_amp (int): Maximum bounce height in pixels
-        flipped (bool): Whether image is currently flipped
-        text (pygame.Surface): Optional text to display during animation
+        animation (AnimationState): Animation timing, scale, flip, and text
     """
     
     def __init__(self, image_path, position, name, size=(64, 64), flipped=False):
@@ -63,21 +108,28 @@ class Character:
         self.name = name
         self.position = position
         self.src_image = self.load_image(image_path, size, flipped)
+        # Transform output is re-converted so blits stay on SDL's native-format path
+        self._flipped_src = pygame.transform.flip(self.src_image, True, False).convert_alpha()
+        self._src_offset = _center_offset(self.src_image.get_size())
+        # (surface, centering offset) keyed by (flipped, width, height), filled on first use
+        self._scale_cache = {}
+        self._last_scale_key = None
+        self._last_scaled = None
         self.current_image = self.src_image.copy()
         self.current_bounce = 0
+        self._draw_offset = self._src_offset
+        
+        # Name never changes, so render the label once
+        self._label_surface = _get_label_font().render(self.name, True, WHITE)
         
-        # Animation state dictionary
-        self.animation = {
-            'is_animating': False,
-            'start_time': 0,
-            'duration': ANIMATION_DURATION,
-            'start_scale': 1.0,
-            'target_scale': 1.2,  # 20% larger at peak
-            'bounce_height': 0,
-            'bounce_amp': BOUNCE_AMPLITUDE,
-            'flipped': False,
-            'text': None  # Optional text surface to display
+        # At rest the image and label never move relative to each other, so
+        # composite them once per flip state: {flipped: (surface, offset)}
+        self._idle_composites = {
+            False: self._build_idle_composite(self.src_image),
+            True: self._build_idle_composite(self._flipped_src),
         }
+        
+        self.animation = AnimationState()
     
     def load_image(self, filename, size, flip):
         """
@@ -103,11 +155,40 @@ class Character:
             return image
         except (pygame.error, FileNotFoundError):
             print(f"Could not load image: {filename}")
-            # Create red placeholder rectangle
-            placeholder = pygame.Surface(size)
-            placeholder.fill((255, 0, 0))
+            # Reuse (or create once) a red placeholder rectangle of this size
+            placeholder = _placeholder_cache.get(size)
+            if placeholder is None:
+                placeholder = pygame.Surface(size)
+                placeholder.fill((255, 0, 0))
+                placeholder = placeholder.convert()
+                _placeholder_cache[size] = placeholder
             return placeholder
     
+    def _build_idle_composite(self, image):
+        """
+        Pre-render the resting image and name label into a single surface.
+        
+        Uses the same layout as draw(): the image centered on position and
+        the label 40 pixels above it.
+        
+        Args:
+            image (pygame.Surface): Unscaled character image for one flip state
+        
+        Returns:
+            tuple: (pygame.Surface, (x, y)) composite and its offset from position
+        """
+        width, height = image.get_size()
+        image_x, image_y = _center_offset((width, height))
+        left = min(image_x, 0)
+        top = image_y - 40
+        right = max(image_x + width, self._label_surface.get_width())
+        
+        composite = pygame.Surface((right - left, height + 40), pygame.SRCALPHA)
+        # RGBA_MAX onto the transparent surface copies pixels without re-blending
+        composite.blit(self._label_surface, (-left, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        composite.blit(image, (image_x - left, 40), special_flags=pygame.BLEND_RGBA_MAX)
+        return composite.convert_alpha(), (left, top)
+    
     def start_animation(self, current_time, text=None):
         """
         Initiate a new bounce animation with optional text overlay.
@@ -119,11 +200,12 @@ class Character:
             current_time (int): Current game time in milliseconds
             text (pygame.Surface, optional): Rendered text to display during animation
         """
-        if not self.animation['is_animating']:
-            self.animation['is_animating'] = True
-            self.animation['start_time'] = current_time
-            self.animation['flipped'] = not self.animation['flipped']
-            self.animation['text'] = text
+        animation = self.animation
+        if not animation.is_animating:
+            animation.is_animating = True
+            animation.start_time = current_time
+            animation.flipped = not animation.flipped
+            animation.text = text
     
     def update(self, current_time):
         """
@@ -136,40 +218,58 @@ class Character:
         Args:
             current_time (int): Current game time in milliseconds
         """
-        if not self.animation['is_animating']:
+        animation = self.animation
+        if not animation.is_animating:
             return
         
         # Calculate animation progress (0.0 to 1.0)
-        elapsed = current_time - self.animation['start_time']
-        progress = min(elapsed / self.animation['duration'], 1.0)
+        elapsed = current_time - animation.start_time
+        progress = min(elapsed / animation.duration, 1.0)
         
         # End animation when complete
         if progress >= 1.0:
-            self.animation['is_animating'] = False
+            animation.is_animating = False
+            # Come to rest unscaled at the base position
+            self.current_image = self._flipped_src if animation.flipped else self.src_image
+            self.current_bounce = 0
+            self._draw_offset = self._src_offset
             return
         
         # Apply bounce easing for natural motion
         bounce_progress = ease_out_bounce(progress)
         # Scale from 1.0 to target_scale and back
-        scale = 1.0 + (self.animation['target_scale'] - 1.0) * (1.0 - bounce_progress)
+        scale = 1.0 + (animation.target_scale - 1.0) * (1.0 - bounce_progress)
         # Vertical bounce using sine wave (peaks at 0.5 progress)
-        bounce_height = math.sin(progress * math.pi) * self.animation['bounce_amp']
-        
-        # Apply transformations to image
-        img = self.src_image
+        bounce_height = math.sin(progress * math.pi) * animation.bounce_amp
         
-        # Flip if needed
-        if self.animation['flipped']:
-            img = pygame.transform.flip(img, True, False)
+        # Pick the pre-flipped source instead of flipping every frame
+        img = self._flipped_src if animation.flipped else self.src_image
+        offset = self._src_offset
         
-        # Scale if changed
+        # Scale if changed, snapping to a cached bucket instead of rescaling
         if scale != 1.0:
-            new_width = int(img.get_width() * scale)
-            new_height = int(img.get_height() * scale)
-            img = pygame.transform.scale(img, (new_width, new_height))
+            target_scale = animation.target_scale
+            bucket = int(round((scale - 1.0) / (target_scale - 1.0) * SCALE_BUCKETS))
+            bucket_scale = 1.0 + (target_scale - 1.0) * bucket / SCALE_BUCKETS
+            new_width = int(img.get_width() * bucket_scale)
+            new_height = int(img.get_height() * bucket_scale)
+            
+            # Reuse last frame's surface when the pixel size did not change
+            if (new_width, new_height) != img.get_size():
+                key = (animation.flipped, new_width, new_height)
+                if key != self._last_scale_key:
+                    entry = self._scale_cache.get(key)
+                    if entry is None:
+                        scaled = pygame.transform.scale(img, (new_width, new_height)).convert_alpha()
+                        entry = (scaled, _center_offset((new_width, new_height)))
+                        self._scale_cache[key] = entry
+                    self._last_scale_key = key
+                    self._last_scaled = entry
+                img, offset = self._last_scaled
         
         # Update display state
         self.current_image = img
+        self._draw_offset = offset
         self.current_bounce = -bounce_height  # Negative = upward
     
     def draw(self, screen):
@@ -182,25 +282,36 @@ class Character:
         
         Args:
             screen (pygame.Surface): Surface to draw on
+        
+        Returns:
+            list: pygame.Rect areas that were drawn this frame
         """
-        # Calculate position accounting for scaling and bounce
-        # Center scaled image on original position
-        draw_pos = [
-            self.position[0] - (self.current_image.get_width() - 64) // 2,
-            self.position[1] + self.current_bounce - (self.current_image.get_height() - 64) // 2
-        ]
+        animation = self.animation
+        if not animation.is_animating and self.current_bounce == 0:
+            # Idle: one blit of the pre-composited image and label
+            composite, offset = self._idle_composites[animation.flipped]
+            return [screen.blit(composite, (self.position[0] + offset[0],
+                                            self.position[1] + offset[1]))]
+        
+        # Calculate position accounting for scaling and bounce, using the
+        # centering offset precomputed for the current image
+        offset = self._draw_offset
+        draw_pos = (
+            self.position[0] + offset[0],
+            self.position[1] + self.current_bounce + offset[1]
+        )
         
         # Draw character image
-        screen.blit(self.current_image, draw_pos)
+        dirty = [screen.blit(self.current_image, draw_pos)]
         
         # Draw name label above character
-        font = pygame.font.Font(None, 36)
-        label = font.render(self.name, True, WHITE)
-        screen.blit(label, (self.position[0], draw_pos[1] - 40))
+        dirty.append(screen.blit(self._label_surface, (self.position[0], draw_pos[1] - 40)))
         
         # Draw text bubble during animation if present
-        if self.animation.get('text') and self.animation['is_animating']:
+        if animation.text and animation.is_animating:
             # Position text to the side based on character name
             text_offset = 80 if self.name == "Kwimi" else -80
             text_pos = (draw_pos[0] + text_offset, draw_pos[1])
-            screen.blit(self.animation['text'], text_pos)
\ No newline at end of file
+            dirty.append(screen.blit(animation.text, text_pos))
+        
+        return dirty
\ No newline at end of file
@@ -6,6 +6,8 @@ import pygame
 # =============================================================================
 WIDTH, HEIGHT = 800, 600  # Window resolution in pixels
 FPS = 60  # Target frames per second for smooth animation
+MAX_FRAME_MS = 250  # Longest frame time the fixed-step update catches up on
+FRAME_SNAP_MS = 1  # Frame times this close to 1/FPS count as exactly one step
 
 # =============================================================================
 # Color Definitions (RGB format: 0-255)
@@ -35,6 +37,7 @@ FIREWORK_COLORS = [
     (255, 200, 100),  # Orange
     (200, 100, 255),  # Purple
 ]
+MAX_PARTICLES = 2048  # Capacity of the shared explosion particle arrays
 
 # =============================================================================
 # Character Text Content
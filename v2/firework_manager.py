@@ -2,23 +2,47 @@
 Firework Manager Module
 =======================
 
-Manages the creation, updating, and lifecycle of fireworks.
+Manages the creation, updating, and lifecycle of fireworks and the particles
+their explosions leave behind.
 
 Classes:
-    FireworkManager: Handles a list of fireworks and their operations
+    FireworkManager: Handles a list of fireworks and the shared particle pool
 """
-from particles import Firework
-import random
+from particles import Firework, ParticleSystem
 from config import WIDTH, HEIGHT, FIREWORK_COLORS
+from utils import rng
+
+# Number of launches drawn per refill of the random launch buffers
+RANDOM_BUFFER_SIZE = 4096
 
 
 class FireworkManager:
     """
     Manages active fireworks, including adding new ones and updating them.
+    
+    Attributes:
+        fireworks (list): Rockets still in their launch phase
+        particle_cache (ParticleCache): Heart sprites, pixel squares and tints
+        particles (ParticleSystem): Shared pool every explosion spawns into
+    
+    Launch positions and colors come from buffers filled in bulk from the
+    shared NumPy Generator, so add_firework only reads the next entry.
     """
     def __init__(self, particle_cache):
         self.fireworks = []
         self.particle_cache = particle_cache
+        self.particles = ParticleSystem(particle_cache)
+        self._refill_random()
+
+    def _refill_random(self):
+        """Draw the next RANDOM_BUFFER_SIZE launch parameters in bulk."""
+        integers = rng.integers
+        # Converted to lists so add_firework gets plain Python ints
+        self._rand_start_x = integers(50, WIDTH - 50, RANDOM_BUFFER_SIZE, endpoint=True).tolist()
+        self._rand_target_x = integers(100, WIDTH - 100, RANDOM_BUFFER_SIZE, endpoint=True).tolist()
+        self._rand_target_y = integers(50, HEIGHT // 2, RANDOM_BUFFER_SIZE, endpoint=True).tolist()
+        self._rand_color = integers(0, len(FIREWORK_COLORS), RANDOM_BUFFER_SIZE).tolist()
+        self._rand_cursor = 0
     
     def add_firework(self, particle_type="heart"):
         """
@@ -27,26 +51,40 @@ class FireworkManager:
         Args:
             particle_type (str): "heart" or "pixel"
         """
+        i = self._rand_cursor
+        if i == RANDOM_BUFFER_SIZE:
+            self._refill_random()
+            i = 0
+        self._rand_cursor = i + 1
         
-        start_x = random.randint(50, WIDTH - 50)
+        start_x = self._rand_start_x[i]
         start_y = HEIGHT
-        target_x = random.randint(100, WIDTH - 100)
-        target_y = random.randint(50, HEIGHT // 2)
-        color = random.choice(FIREWORK_COLORS)
+        target_x = self._rand_target_x[i]
+        target_y = self._rand_target_y[i]
+        color = FIREWORK_COLORS[self._rand_color[i]]
         
-        firework = Firework(start_x, start_y, target_x, target_y, color, particle_type, self.particle_cache)
+        firework = Firework(start_x, start_y, target_x, target_y, color, particle_type, self.particles)
         self.fireworks.append(firework)
-    
+
     def update_fireworks(self):
         """
-        Update all fireworks and remove completed ones.
+        Update all fireworks and particles, removing completed rockets.
         
         Returns:
             List of active fireworks
         """
-        self.fireworks = [fw for fw in self.fireworks if fw.update()]
-        return self.fireworks
+        # Compact in place so no new list is allocated each frame
+        fireworks = self.fireworks
+        write = 0
+        for firework in fireworks:
+            if firework.update():
+                fireworks[write] = firework
+                write += 1
+        del fireworks[write:]
+
+        self.particles.step()
+        return fireworks
     
     def get_fireworks(self):
         """Return the current list of fireworks."""
-        return self.fireworks
\ No newline at end of file
+        return self.fireworks
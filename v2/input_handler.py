@@ -17,9 +17,20 @@ class InputHandler:
     
     Tracks timers for continuous key presses and provides methods to
     process input for characters and fireworks.
+    
+    Attributes:
+        t_space, t_p, t_kg (int): Frames the SPACE, P and K+G keys have been held
     """
     def __init__(self):
-        self.timers = {'space': 0, 'p': 0, 'kg': 0}
+        # Frame counters for held keys
+        self.t_space = 0
+        self.t_p = 0
+        self.t_kg = 0
+
+        # Text bubbles are constant, so render them once (requires pygame.init())
+        self._font24 = pygame.font.Font(None, 24)
+        self._kwimi_text = self._font24.render(TEXT_KWIMI, True, WHITE)
+        self._grogu_text = self._font24.render(TEXT_GROGU, True, WHITE)
 
     def process_input(self, keys, kwimi, grogu, firework_manager, current_time):
         """
@@ -32,42 +43,49 @@ class InputHandler:
             firework_manager: FireworkManager instance
             current_time: Current time in milliseconds
         """
+        # Read each key once; the conditions below only test these locals
+        k_space = keys[pygame.K_SPACE]
+        k_p = keys[pygame.K_p]
+        k_k = keys[pygame.K_k]
+        k_g = keys[pygame.K_g]
+        k_kg = k_k and k_g
+
+        # Bind animation state once for the checks below
+        ka = kwimi.animation
+        ga = grogu.animation
+
         # Firework controls
-        if keys[pygame.K_SPACE]:
-            self.timers['space'] += 1
-            if self.timers['space'] % 8 == 0:
+        if k_space:
+            self.t_space += 1
+            if self.t_space % 8 == 0:
                 firework_manager.add_firework("heart")
         else:
-            self.timers['space'] = 0
+            self.t_space = 0
 
-        if keys[pygame.K_p] and not (keys[pygame.K_k] and keys[pygame.K_g]):
-            self.timers['p'] += 1
-            if self.timers['p'] % 8 == 0:
+        if k_p and not k_kg:
+            self.t_p += 1
+            if self.t_p % 8 == 0:
                 firework_manager.add_firework("pixel")
         else:
-            self.timers['p'] = 0
+            self.t_p = 0
 
-        # Character animations
-        if keys[pygame.K_LEFT] and not kwimi.animation['is_animating']:
-            kwimi.start_animation(current_time)
-        
-        if keys[pygame.K_RIGHT] and not grogu.animation['is_animating']:
-            grogu.start_animation(current_time)
-        
-        if keys[pygame.K_k] and not kwimi.animation['is_animating']:
-            font = pygame.font.Font(None, 24)
-            text = font.render(TEXT_KWIMI, True, WHITE)
-            kwimi.start_animation(current_time, text)
+        # Character animations; an arrow key starts first and wins over K/G
+        if not ka.is_animating:
+            if keys[pygame.K_LEFT]:
+                kwimi.start_animation(current_time)
+            elif k_k:
+                kwimi.start_animation(current_time, self._kwimi_text)
         
-        if keys[pygame.K_g] and not grogu.animation['is_animating']:
-            font = pygame.font.Font(None, 24)
-            text = font.render(TEXT_GROGU, True, WHITE)
-            grogu.start_animation(current_time, text)
+        if not ga.is_animating:
+            if keys[pygame.K_RIGHT]:
+                grogu.start_animation(current_time)
+            elif k_g:
+                grogu.start_animation(current_time, self._grogu_text)
 
         # Romance combo
-        if keys[pygame.K_k] and keys[pygame.K_g]:
-            self.timers['kg'] += 1
-            if self.timers['kg'] % 4 == 0:
+        if k_kg:
+            self.t_kg += 1
+            if self.t_kg % 4 == 0:
                 firework_manager.add_firework("heart")
         else:
-            self.timers['kg'] = 0
\ No newline at end of file
+            self.t_kg = 0
\ No newline at end of file
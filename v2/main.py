@@ -18,13 +18,20 @@ Usage:
 """
 import pygame
 import sys
-from config import WIDTH, HEIGHT, FPS, FACE_IMAGE_PATH, HEART_IMAGE_PATH
+from config import WIDTH, HEIGHT, FPS, MAX_FRAME_MS, FRAME_SNAP_MS, FACE_IMAGE_PATH, HEART_IMAGE_PATH, FIREWORK_COLORS
 from particles import ParticleCache
 from character import Character
 from input_handler import InputHandler
 from renderer import Renderer
 from firework_manager import FireworkManager
 
+# Events meaning the window contents may need repainting; the WINDOW* types
+# only exist in pygame 2
+REDRAW_EVENTS = [pygame.VIDEOEXPOSE] + [
+    getattr(pygame, name) for name in ('WINDOWEVENT', 'WINDOWEXPOSED', 'WINDOWRESTORED', 'WINDOWSHOWN')
+    if hasattr(pygame, name)
+]
+
 
 class Game:
     """Main game controller"""
@@ -34,9 +41,15 @@ class Game:
         pygame.display.set_caption("Pygame Organized Game")
         self.clock = pygame.time.Clock()
         
+        # Only QUIT and repaint events are read from the queue; input comes
+        # from key.get_pressed()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT] + REDRAW_EVENTS)
+        
         # Initialize particle system with cached images for performance
         self.particle_cache = ParticleCache()
         self.particle_cache.preload_heart_images(HEART_IMAGE_PATH)
+        self.particle_cache.preload_pixel_squares(FIREWORK_COLORS)
         
         # Create two characters at different positions
         self.kwimi = Character(FACE_IMAGE_PATH, [100, HEIGHT // 2 - 32], "Kwimi", flipped=True)
@@ -51,27 +64,67 @@ class Game:
         self.running = True
 
     def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        # Pumps SDL and fetches only the event types the game reacts to
+        if pygame.event.get(pygame.QUIT):
+            self.running = False
+        if pygame.event.get(REDRAW_EVENTS):
+            # Window contents may be gone; repaint the static areas too
+            self.renderer.invalidate()
     
     def run(self):
+        # Bind per-frame callables once so the loop skips repeated attribute lookups
+        kwimi, grogu = self.kwimi, self.grogu
+        firework_manager = self.firework_manager
+        handle_events = self.handle_events
+        process_input = self.input_handler.process_input
+        update_fireworks = self.firework_manager.update_fireworks
+        update_kwimi = kwimi.update
+        update_grogu = grogu.update
+        draw_frame = self.renderer.draw_frame
+        get_ticks = pygame.time.get_ticks
+        get_pressed = pygame.key.get_pressed
+        display_update = pygame.display.update
+        tick = self.clock.tick
+
+        # Input timers and firework physics advance in fixed steps of 1/FPS s,
+        # however long rendering takes; the first frame runs one step
+        step_ms = 1000.0 / FPS
+        accumulator = step_ms
+        snap_drift = 0.0
+
         while self.running:
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
 
-            self.handle_events()
-            keys = pygame.key.get_pressed()
-            self.input_handler.process_input(keys, self.kwimi, self.grogu, self.firework_manager, current_time)
-            
-            self.firework_manager.update_fireworks()
-            self.kwimi.update(current_time)
-            self.grogu.update(current_time)
+            handle_events()
+            keys = get_pressed()
+            while accumulator >= step_ms:
+                process_input(keys, kwimi, grogu, firework_manager, current_time)
+                update_fireworks()
+                accumulator -= step_ms
+
+            # Character animations are time-based, so they update once per frame
+            update_kwimi(current_time)
+            update_grogu(current_time)
 
-            self.renderer.draw_frame(self.kwimi, self.grogu, self.firework_manager.get_fireworks())
+            dirty_rects = draw_frame(kwimi, grogu, firework_manager)
             
-            pygame.display.update()
+            # Only push the areas that changed since the last frame
+            display_update(dirty_rects)
 
-            self.clock.tick(FPS)
+            # tick() reports whole milliseconds (16 or 17 at 60 FPS), so a frame
+            # within FRAME_SNAP_MS of 1/FPS counts as exactly one step and never
+            # skips or doubles a step. The rounding is carried in snap_drift and
+            # folded back once it outgrows the tolerance, so a display running
+            # slightly off 60 Hz still tracks real time. Cap catch-up after a
+            # stall so physics cannot spiral behind
+            frame_ms = tick(FPS)
+            if abs(frame_ms - step_ms) <= FRAME_SNAP_MS:
+                snap_drift += frame_ms - step_ms
+                frame_ms = step_ms
+                if abs(snap_drift) > FRAME_SNAP_MS:
+                    frame_ms += snap_drift
+                    snap_drift = 0.0
+            accumulator += min(frame_ms, MAX_FRAME_MS)
 
         pygame.quit()
         sys.exit()
@@ -2,16 +2,17 @@
 Particle System Module
 ======================
 
-Implements a flexible particle system for visual effects including fireworks
-and explosions. Features multiple particle types (hearts, pixels) with physics
-simulation, sprite caching for performance, and lifecycle management.
+Implements the firework rockets, the shared particle pool their explosions
+feed, and the sprite/color caches used to draw it. Particles are stored as
+NumPy arrays (structure of arrays), not as individual objects.
 
 Classes:
-    ParticleCache: Manages pre-loaded and scaled heart images
-    BaseParticle: Abstract base with common particle physics
-    PixelParticle: Simple rectangular particles for pixel-art style effects
-    HeartParticle: Heart-shaped particles using cached sprites
-    Firework: Complete firework with launch and explosion phases
+    ParticleCache: Manages pre-loaded heart images and the particle tint palette
+    ParticleSystem: Pool of all live explosion particles across fireworks
+    Firework: Firework rocket with launch phase, bursting into particles
+
+Functions:
+    step_particles: Advance and compact the particle arrays (Numba kernel)
 
 Physics Features:
     - Gravity simulation
@@ -21,8 +22,54 @@ Physics Features:
 """
 import pygame
 import math
-import random
-from config import FIREWORK_COLORS
+import numpy as np
+from config import WIDTH, HEIGHT, FIREWORK_COLORS, MAX_PARTICLES
+from utils import njit, rng
+
+# Bound once so explode skips the attribute lookups on the shared generator
+_integers = rng.integers
+_uniform = rng.uniform
+
+# Unit vectors for explosion directions, indexed by one of DIRECTIONS evenly spaced angles
+DIRECTIONS = 1024
+_DIR_COS = np.cos(np.linspace(0, 2 * math.pi, DIRECTIONS, endpoint=False))
+_DIR_SIN = np.sin(np.linspace(0, 2 * math.pi, DIRECTIONS, endpoint=False))
+
+# Each firework's particles pick one of COLOR_VARIANTS fixed offsets (±30 per
+# channel) from its base color, so the set of tints is bounded and preloadable
+COLOR_VARIANTS = 8
+_VARIANT_OFFSETS = rng.integers(-30, 30, (COLOR_VARIANTS, 3), endpoint=True)
+
+# Pixel particle sizes in pixels
+PIXEL_SIZES = range(2, 7)
+
+# Particle kinds, stored per particle in ParticleSystem.kind
+HEART, PIXEL = 0, 1
+
+# Tint channels are rounded down to multiples of 8 so color variants share entries
+TINT_MASK = 0xF8
+
+# Pre-baked fade levels for particle sprites; 0-255 alpha maps to a level via alpha >> 4
+FADE_LEVELS = 16
+
+# Rocket trail circles as (distance in frames of travel, brightness, radius)
+TRAIL = [(i * 2, 1 - i * 0.2, max(1, 3 - i)) for i in range(5)]
+
+def color_variants(color):
+    """
+    Return the COLOR_VARIANTS particle colors used for a firework color.
+    
+    Args:
+        color (tuple): Base RGB color of the firework
+    
+    Returns:
+        numpy.ndarray: (COLOR_VARIANTS, 3) array of clipped RGB colors
+    """
+    return np.clip(np.array(color) + _VARIANT_OFFSETS, 0, 255)
+
+
+# Heart sizes below this are resolved through a direct lookup table
+HEART_LUT_SIZE = 64
 
 
 class ParticleCache:
@@ -34,10 +81,21 @@ class ParticleCache:
     
     Attributes:
         cache (dict): Maps sizes (int) to pre-scaled pygame.Surface objects
+        faded_cache (list): Indexed by size, the FADE_LEVELS faded copies of
+            that heart (None for sizes not baked yet)
+        square_cache (list): Per tint index, a list of solid pixel-particle
+            squares indexed by size * FADE_LEVELS + fade level, filled on first use
+        tint_colors (list): Quantized RGB tuples, indexed by tint index
     """
     
     def __init__(self):
         self.cache = {}
+        self.faded_cache = [None] * HEART_LUT_SIZE
+        self.square_cache = []
+        # Requested size -> resolved heart surface, filled on first request
+        self._heart_lut = [None] * HEART_LUT_SIZE
+        self.tint_colors = []
+        self._tint_lookup = {}
     
     def preload_heart_images(self, heart_path):
         """
@@ -64,6 +122,42 @@ class ParticleCache:
                 heart_surface = pygame.Surface((size, size), pygame.SRCALPHA)
                 heart_surface.fill((255, 182, 203, 255))
                 self.cache[size] = heart_surface
+
+        for size in self.cache:
+            self._bake_faded_hearts(size)
+
+    def _bake_faded_hearts(self, size):
+        """Build the FADE_LEVELS alpha-faded copies of the cached heart of this size."""
+        heart = self.cache[size]
+        levels = []
+        for level in range(FADE_LEVELS):
+            faded = heart.copy()
+            faded.set_alpha((level + 1) * 256 // FADE_LEVELS - 1)
+            levels.append(faded)
+        if size >= len(self.faded_cache):
+            self.faded_cache.extend([None] * (size + 1 - len(self.faded_cache)))
+        self.faded_cache[size] = levels
+        return levels
+
+    def get_faded_heart(self, size, alpha):
+        """
+        Retrieve a pre-faded heart image, quantized to one of FADE_LEVELS alphas.
+        
+        Cached surfaces are shared, so callers must not modify the result.
+        
+        Args:
+            size (int): Size of a heart already in the cache
+            alpha (int): Desired opacity, 0-255
+        
+        Returns:
+            pygame.Surface: Heart image with the nearest baked alpha level
+        """
+        # Direct list index by size; a dict lookup would hash on every draw
+        faded_cache = self.faded_cache
+        levels = faded_cache[size] if size < len(faded_cache) else None
+        if levels is None:
+            levels = self._bake_faded_hearts(size)
+        return levels[alpha * FADE_LEVELS >> 8]
     
     def get_cached_heart(self, size):
         """
@@ -71,7 +165,8 @@ class ParticleCache:
         
         Returns the exact size if cached, or the closest available size if
         the difference is small (<= 5 pixels). For larger differences,
-        scales the closest cached image and caches the new size.
+        scales the closest cached image and caches the new size. Sizes below
+        HEART_LUT_SIZE are resolved once and then served from a lookup table.
         
         Args:
             size (int): Desired heart image size in pixels
@@ -79,11 +174,19 @@ class ParticleCache:
         Returns:
             pygame.Surface: Heart image at the requested size, or None if cache is empty
         """
-        available_sizes = list(self.cache.keys())
-        if not available_sizes:
+        if 0 <= size < HEART_LUT_SIZE:
+            heart = self._heart_lut[size]
+            if heart is None:
+                heart = self._heart_lut[size] = self._find_cached_heart(size)
+            return heart
+        return self._find_cached_heart(size)
+
+    def _find_cached_heart(self, size):
+        """Resolve a heart size against the cache by nearest-size search (see get_cached_heart)."""
+        if not self.cache:
             return None
         
-        closest_size = min(available_sizes, key=lambda x: abs(x - size))
+        closest_size = min(self.cache, key=lambda x: abs(x - size))
         
         if closest_size == size:
             return self.cache[closest_size]
@@ -96,182 +199,302 @@ class ParticleCache:
         
         return self.cache[size]
 
-
-class BaseParticle:
-    """
-    Base class for all particle types with shared physics simulation.
-    
-    Implements common particle behavior including gravity, air resistance,
-    lifetime tracking, and alpha-based color fading. Subclasses should
-    override the draw() method for custom rendering.
-    
-    Attributes:
-        x, y (float): Current particle position in screen coordinates
-        v_x, v_y (float): Velocity components in pixels per frame
-        color (tuple): Original RGB color (0-255 for each channel)
-        current_color (tuple): Faded color based on remaining lifetime
-        size (int): Particle size in pixels
-        life_time (int): Remaining lifetime in frames
-        max_life (int): Initial lifetime for fade calculations
-        gravity (float): Downward acceleration per frame
-    """
-    
-    def __init__(self, x, y, v_x, v_y, color, size, life_time):
+    def get_tint_index(self, color):
         """
-        Initialize a new particle with physics properties.
+        Return the palette index for a particle color, adding it on first use.
+        
+        Channels are quantized with TINT_MASK, so the small random variation
+        between particles of one firework maps onto a handful of entries.
         
         Args:
-            x (float): Starting x-coordinate
-            y (float): Starting y-coordinate
-            v_x (float): Initial horizontal velocity (pixels/frame)
-            v_y (float): Initial vertical velocity (pixels/frame)
             color (tuple): RGB color tuple (r, g, b) with values 0-255
-            size (int): Particle size in pixels
-            life_time (int): How many frames the particle should exist
+        
+        Returns:
+            int: Index into tint_colors
         """
-        self.x = x
-        self.y = y
-        self.v_x = v_x
-        self.v_y = v_y
-        self.color = color
-        self.current_color = color
-        self.size = size
-        self.life_time = life_time
-        self.max_life = life_time
-        self.gravity = 0.1
+        key = (color[0] & TINT_MASK, color[1] & TINT_MASK, color[2] & TINT_MASK)
+        index = self._tint_lookup.get(key)
+        if index is None:
+            index = len(self.tint_colors)
+            self._tint_lookup[key] = index
+            self.tint_colors.append(key)
+            self.square_cache.append([])
+        return index
 
-    def update(self):
+    def preload_pixel_squares(self, base_colors):
         """
-        Update particle physics and lifetime for one frame.
+        Register every color variant of the given firework colors and bake
+        their pixel squares at all PIXEL_SIZES and fade levels.
         
-        Applies velocity to position, adds gravity, applies air resistance,
-        decrements lifetime, and calculates faded color based on remaining life.
+        After this, pixel particles of these colors never create surfaces
+        while drawing.
         
-        Returns:
-            bool: True if particle is still alive, False if lifetime expired
+        Args:
+            base_colors (list): RGB firework colors, e.g. FIREWORK_COLORS
         """
-        # Apply velocity to position
-        self.x += self.v_x
-        self.y += self.v_y
-        
-        # Apply physics forces
-        self.v_y += self.gravity  # Gravity pulls down
-        self.v_x *= 0.99  # Air resistance slows horizontal movement
-
-        # Age the particle
-        self.life_time -= 1
-
-        # Fade color proportionally to remaining life (alpha blending)
-        alpha = self.life_time / self.max_life
-        self.current_color = (
-            int(self.color[0] * alpha),
-            int(self.color[1] * alpha),
-            int(self.color[2] * alpha)
-        )
-
-        return self.life_time > 0
-    
-    def draw(self, screen):
+        for base_color in base_colors:
+            for color in color_variants(base_color).tolist():
+                tint_index = self.get_tint_index(color)
+                for size in PIXEL_SIZES:
+                    for level in range(FADE_LEVELS):
+                        self.get_pixel_square(tint_index, size, level * 256 // FADE_LEVELS)
+
+    def get_pixel_square(self, tint_index, size, alpha):
         """
-        Render the particle to the screen. Override in subclasses.
+        Retrieve a solid pixel-particle square, faded to one of FADE_LEVELS.
+        
+        The tint is darkened toward black by the level's alpha, matching how
+        pixel particles fade. Squares are opaque and in display format, so
+        they blit as plain copies.
         
         Args:
-            screen (pygame.Surface): Surface to draw on
+            tint_index (int): Index returned by get_tint_index()
+            size (int): Square side in pixels
+            alpha (int): Remaining opacity, 0-255
+        
+        Returns:
+            pygame.Surface: Cached square for this tint, size and fade level
         """
-        pass
+        level = alpha * FADE_LEVELS >> 8
+        # Flat list index instead of a (tint, size, level) dict key per lookup
+        squares = self.square_cache[tint_index]
+        slot = size * FADE_LEVELS + level
+        if slot < len(squares):
+            square = squares[slot]
+            if square is not None:
+                return square
+        else:
+            squares.extend([None] * (slot + 1 - len(squares)))
 
+        scale = ((level + 1) * 256 // FADE_LEVELS - 1) / 255
+        r, g, b = self.tint_colors[tint_index]
+        square = pygame.Surface((size, size))
+        square.fill((int(r * scale), int(g * scale), int(b * scale)))
+        square = square.convert()
+        squares[slot] = square
+        return square
 
-class PixelParticle(BaseParticle):
+
+@njit('int64(float32[:], float32[:], float32[:], float32[:], int16[:], int16[:], '
+      'int16[:], uint16[:], int8[:], int64, float64)', cache=True, fastmath=True)
+def step_particles(px, py, vx, vy, life, max_life, size, color_idx, kind, n, gravity):
     """
-    Simple rectangular particles for retro pixel-art style effects.
+    Apply one frame of physics to the first n particles, removing expired ones.
     
-    Draws as small colored squares, useful for traditional firework effects
-    or when heart images are not desired.
-    """
+    Particles that have left the screen for good (below the bottom while
+    falling, or past a side edge while moving away from it; drag never
+    reverses vx) are removed early instead of being stepped until their
+    lifetime runs out.
     
-    def draw(self, screen):
-        """
-        Draw particle as a colored rectangle.
-        
-        Args:
-            screen (pygame.Surface): Surface to draw on
-        """
-        if self.life_time > 0:
-            particle_rect = pygame.Rect(int(self.x), int(self.y), self.size, self.size)
-            pygame.draw.rect(screen, self.current_color, particle_rect)
+    Physics and removal run in a single pass. An expired particle is
+    overwritten by the last live particle (swap-with-last), which is then
+    stepped in its new slot, so survivors are never moved and the live
+    particles stay contiguous. Runs compiled (signature given, so no
+    first-call latency) when Numba is installed, otherwise as a plain
+    Python loop.
+    
+    Args:
+        px, py (numpy.ndarray): float32 particle positions
+        vx, vy (numpy.ndarray): float32 particle velocities
+        life, max_life (numpy.ndarray): int16 remaining and initial lifetimes
+        size (numpy.ndarray): int16 particle sizes
+        color_idx (numpy.ndarray): uint16 tint indices
+        kind (numpy.ndarray): int8 particle kinds
+        n (int): Number of live particles at the front of the arrays
+        gravity (float): Downward acceleration per frame
+    
+    Returns:
+        int: Number of particles still alive
+    """
+    i = 0
+    while i < n:
+        x = px[i]
+        off_screen = ((py[i] > HEIGHT and vy[i] >= 0)
+                      or (x > WIDTH and vx[i] >= 0)
+                      or (x + size[i] < 0 and vx[i] <= 0))
+        if life[i] > 1 and not off_screen:
+            px[i] += vx[i]
+            py[i] += vy[i]
+            vy[i] += gravity  # Gravity pulls down
+            vx[i] *= 0.99  # Air resistance slows horizontal movement
+            life[i] -= 1
+            i += 1
+        else:
+            # Expires or left the screen: move the (not yet stepped) last particle here
+            n -= 1
+            px[i] = px[n]
+            py[i] = py[n]
+            vx[i] = vx[n]
+            vy[i] = vy[n]
+            life[i] = life[n]
+            max_life[i] = max_life[n]
+            size[i] = size[n]
+            color_idx[i] = color_idx[n]
+            kind[i] = kind[n]
+    return n
 
 
-class HeartParticle(BaseParticle):
+class ParticleSystem:
     """
-    Heart-shaped particles using pre-cached sprite images.
+    Single pool holding every live explosion particle, whichever firework spawned it.
     
-    Uses the ParticleCache to retrieve appropriately sized heart images,
-    applying alpha transparency for smooth fading effects.
+    Particles are stored as parallel NumPy arrays (structure of arrays), so
+    one physics step and one batched draw per frame cover all fireworks.
+    Live particles are kept packed in the first n slots; that contiguous
+    prefix plays the role of a free list, since the next free slot is
+    always n.
     
     Attributes:
-        heart_image (pygame.Surface): Cached heart sprite for this size
+        particle_cache (ParticleCache): Heart sprites, pixel squares and tints
+        n (int): Number of live particles, stored in slots [0, n)
+        px, py (numpy.ndarray): Particle positions
+        vx, vy (numpy.ndarray): Particle velocities in pixels per frame
+        life (numpy.ndarray): Remaining lifetime in frames
+        max_life (numpy.ndarray): Initial lifetime for fade calculations
+        size (numpy.ndarray): Particle size in pixels (heart sizes are
+            snapped to a cached sprite size at spawn)
+        color_idx (numpy.ndarray): Tint index from ParticleCache.get_tint_index
+        kind (numpy.ndarray): HEART or PIXEL
+        gravity (float): Downward acceleration per frame
     """
     
-    def __init__(self, x, y, v_x, v_y, color, size, life_time, particle_cache):
+    def __init__(self, particle_cache, capacity=MAX_PARTICLES):
         """
-        Create a heart particle with cached sprite.
+        Allocate the particle arrays.
         
         Args:
-            x, y (float): Starting position
-            v_x, v_y (float): Initial velocity
-            color (tuple): RGB color (not used directly, sprite has own color)
-            size (int): Desired heart size in pixels
-            life_time (int): Lifetime in frames
-            particle_cache (ParticleCache): Cache to retrieve heart sprite from
+            particle_cache (ParticleCache): Cache used to resolve sprites and tints
+            capacity (int): Maximum number of particles alive at once
         """
-        super().__init__(x, y, v_x, v_y, color, size, life_time)
-        self.heart_image = particle_cache.get_cached_heart(size)
-    
+        self.particle_cache = particle_cache
+        self.n = 0
+        self.px = np.zeros(capacity, dtype=np.float32)
+        self.py = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        # Integer columns use the narrowest type that fits (lifetimes are
+        # under a few hundred frames, tints quantize to at most 32**3 entries)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.max_life = np.ones(capacity, dtype=np.int16)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.color_idx = np.zeros(capacity, dtype=np.uint16)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.gravity = 0.1
+
+    def spawn_batch(self, x, y, v_x, v_y, colors, sizes, life_times, kind):
+        """
+        Append a burst of particles after the live ones.
+        
+        Tints and heart sprite sizes are resolved here, once per particle,
+        so drawing only has to index the caches. Particles beyond the
+        capacity are dropped, and so are heart bursts when no heart image
+        is cached.
+        
+        Args:
+            x, y (float): Burst origin shared by all particles
+            v_x, v_y (list): Initial velocity of each particle
+            colors (list): RGB color tuple of each particle
+            sizes (list): Size of each particle in pixels
+            life_times (list): Lifetime of each particle in frames
+            kind (int): HEART or PIXEL for the whole burst
+        """
+        start = self.n
+        count = min(len(sizes), len(self.px) - start)
+        if count <= 0:
+            return
+        slots = slice(start, start + count)
+
+        if kind == HEART:
+            get_cached_heart = self.particle_cache.get_cached_heart
+            hearts = [get_cached_heart(size) for size in sizes[:count]]
+            if None in hearts:
+                return  # Heart cache is empty, there is nothing to draw
+            sizes = [heart.get_width() for heart in hearts]
+        get_tint_index = self.particle_cache.get_tint_index
+
+        self.px[slots] = x
+        self.py[slots] = y
+        self.vx[slots] = v_x[:count]
+        self.vy[slots] = v_y[:count]
+        self.life[slots] = life_times[:count]
+        self.max_life[slots] = life_times[:count]
+        self.size[slots] = sizes[:count]
+        self.color_idx[slots] = [get_tint_index(color) for color in colors[:count]]
+        self.kind[slots] = kind
+        self.n = start + count
+
+    def step(self):
+        """Advance all live particles one frame and drop the ones that expired."""
+        self.n = step_particles(self.px, self.py, self.vx, self.vy, self.life,
+                                self.max_life, self.size, self.color_idx, self.kind,
+                                self.n, self.gravity)
+
     def draw(self, screen):
         """
-        Draw heart sprite with alpha fading.
+        Draw every live particle with a single Surface.blits() call.
+        
+        Fade alphas are computed for all particles in one integer vectorized
+        pass. Hearts and pixel squares both come pre-faded from the
+        ParticleCache, so no per-particle color is ever built.
         
         Args:
             screen (pygame.Surface): Surface to draw on
+        
+        Returns:
+            list: pygame.Rect areas that were drawn
         """
-        if self.life_time > 0 and self.heart_image:
-            # Calculate fade alpha (0-255)
-            alpha = int(255 * (self.life_time / self.max_life))
-            
-            if alpha < 255:
-                # Create faded copy for this frame
-                faded_heart = self.heart_image.copy()
-                faded_heart.set_alpha(alpha)
-                screen.blit(faded_heart, (int(self.x), int(self.y)))
+        n = self.n
+        if not n:
+            return []
+
+        cache = self.particle_cache
+        xs = self.px[:n].astype(np.int32).tolist()
+        ys = self.py[:n].astype(np.int32).tolist()
+        sizes = self.size[:n].tolist()
+        kinds = self.kind[:n].tolist()
+        tints = self.color_idx[:n].tolist()
+        # Floor division gives the same 0-255 alpha as int(255 * life / max_life)
+        alphas = (np.multiply(self.life[:n], 255, dtype=np.int32) // self.max_life[:n]).tolist()
+
+        get_faded_heart = cache.get_faded_heart
+        get_pixel_square = cache.get_pixel_square
+        blit_list = []
+        for x, y, size, kind, tint, alpha in zip(xs, ys, sizes, kinds, tints, alphas):
+            if kind == HEART:
+                blit_list.append((get_faded_heart(size, alpha), (x, y)))
             else:
-                # Full opacity, draw directly
-                screen.blit(self.heart_image, (int(self.x), int(self.y)))
+                blit_list.append((get_pixel_square(tint, size, alpha), (x, y)))
+
+        # One C-level call for every particle, returning their rects
+        return screen.blits(blit_list, doreturn=True)
 
 
 class Firework:
     """
-    Complete firework effect with launch and explosion phases.
+    Firework rocket that launches toward a target and bursts into particles.
     
-    Simulates a firework that launches from a starting point toward a target,
-    then explodes into multiple particles when it reaches the destination.
+    Only the launch phase is simulated here. When the rocket reaches its
+    target the burst is handed to a particle store (normally the shared
+    ParticleSystem), which keeps every live particle in NumPy arrays.
     
     Lifecycle:
         1. Launch phase: Projectile moves toward target with trailing effect
         2. Explosion trigger: When near target, spawns particle burst
-        3. Particle phase: Individual particles follow physics until they fade
+        3. Particle phase: Handled by the particle store until particles fade
     
     Attributes:
         x, y (float): Current projectile position
         target_x, target_y (float): Destination coordinates
         color (tuple): RGB color for projectile and particles
         particle_type (str): "heart" or "pixel" for explosion particles
-        particle_cache (ParticleCache): Cache for heart sprites (if needed)
+        particle_store (ParticleSystem): Receives the explosion particles
         v_x, v_y (float): Projectile velocity components
         exploded (bool): Whether explosion has occurred
-        particles (list): Active particles from explosion
     """
+    __slots__ = ('x', 'y', 'target_x', 'target_y', 'color', 'particle_type', 'particle_store',
+                 'v_x', 'v_y', 'exploded', '_sprite', '_sprite_offset')
     
-    def __init__(self, x, y, target_x, target_y, color, particle_type="heart", particle_cache=None):
+    def __init__(self, x, y, target_x, target_y, color, particle_type="heart", particle_store=None):
         """
         Create a new firework.
         
@@ -280,7 +503,8 @@ class Firework:
             target_x, target_y (float): Explosion point
             color (tuple): RGB color tuple
             particle_type (str): "heart" or "pixel" for particle style
-            particle_cache (ParticleCache): Required if using heart particles
+            particle_store (ParticleSystem): Pool whose spawn_batch() receives
+                the burst; without one the burst is dropped
         """
         self.x = x
         self.y = y
@@ -288,23 +512,51 @@ class Firework:
         self.target_y = target_y
         self.color = color
         self.particle_type = particle_type
-        self.particle_cache = particle_cache
+        self.particle_store = particle_store
         # Calculate velocity to reach target (2% of distance per frame)
         self.v_x = (target_x - x) * 0.02
         self.v_y = (target_y - y) * 0.02
         self.exploded = False
-        self.particles = []
+        # Velocity is constant during launch, so the rocket looks the same every frame
+        self._sprite, self._sprite_offset = self._build_sprite()
+
+    def _build_sprite(self):
+        """
+        Pre-render the projectile and its fading trail into one surface.
+        
+        Returns:
+            tuple: (pygame.Surface, (x, y)) sprite and the offset of its
+                top-left corner from the projectile position
+        """
+        # Projectile first, then the trail circles in draw order
+        circles = [(0, 0, self.color, 3)]
+        for distance, brightness, radius in TRAIL:
+            trail_color = (
+                int(self.color[0] * brightness),
+                int(self.color[1] * brightness),
+                int(self.color[2] * brightness)
+            )
+            circles.append((int(-self.v_x * distance), int(-self.v_y * distance),
+                            trail_color, radius))
+
+        left = min(dx for dx, _, _, _ in circles) - 3
+        top = min(dy for _, dy, _, _ in circles) - 3
+        width = max(dx for dx, _, _, _ in circles) - left + 4
+        height = max(dy for _, dy, _, _ in circles) - top + 4
+
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        for dx, dy, color, radius in circles:
+            pygame.draw.circle(sprite, color, (dx - left, dy - top), radius)
+        return sprite.convert_alpha(), (left, top)
 
     def update(self):
         """
-        Update firework state for one frame.
+        Update the rocket for one frame.
         
-        In launch phase: moves toward target, checks for arrival.
-        In explosion phase: updates all particles and removes dead ones.
+        Moves toward the target and explodes on arrival.
         
         Returns:
-            bool: True if firework still active (launching or has particles),
-                  False if completely finished
+            bool: True while the rocket is still launching, False once exploded
         """
         if not self.exploded:
             # Launch phase: move toward target
@@ -314,11 +566,8 @@ class Firework:
             # Check if close enough to target (within 10 pixels)
             if abs(self.x - self.target_x) < 10 and abs(self.y - self.target_y) < 10:
                 self.explode()
-        else:
-            # Explosion phase: update particles and remove dead ones
-            self.particles = [p for p in self.particles if p.update()]
 
-        return len(self.particles) > 0 or not self.exploded
+        return not self.exploded
     
     def explode(self):
         """
@@ -326,72 +575,49 @@ class Firework:
         
         Spawns 5-15 particles radiating in random directions with varying
         speeds, sizes, and lifetimes. Particle properties depend on the
-        particle_type setting.
+        particle_type setting. All random values for the burst are drawn in
+        a few vectorized calls and written to the particle store in one call.
         """
         self.exploded = True
-        particle_count = random.randint(5, 15)  # Random number of particles
-
-        for _ in range(particle_count):
-            # Random direction (angle in radians)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            # Convert polar to Cartesian coordinates
-            v_x = math.cos(angle) * speed
-            v_y = math.sin(angle) * speed
-
-            # Particle properties vary by type
-            if self.particle_type == "heart":
-                size = random.randint(25, 40)  # Larger hearts
-                life_time = random.randint(30, 60)  # Longer life
-            else:  # pixel particles
-                size = random.randint(2, 6)  # Smaller pixels
-                life_time = random.randint(20, 40)  # Shorter life
-            
-            # Add color variation (±30 to each RGB channel)
-            color_variant = (
-                min(255, max(0, self.color[0] + random.randint(-30, 30))),
-                min(255, max(0, self.color[1] + random.randint(-30, 30))),
-                min(255, max(0, self.color[2] + random.randint(-30, 30)))
-            )
+        n = int(_integers(5, 15, endpoint=True))  # Random number of particles
 
-            # Create appropriate particle type
-            if self.particle_type == "heart":
-                particle = HeartParticle(self.x, self.y, v_x, v_y, color_variant, 
-                                        size, life_time, self.particle_cache)
-            else:
-                particle = PixelParticle(self.x, self.y, v_x, v_y, color_variant, 
-                                        size, life_time)
-            
-            self.particles.append(particle)
+        # Random directions and speeds, converted from polar to Cartesian
+        # through the precomputed direction table
+        directions = _integers(0, DIRECTIONS, n)
+        speeds = _uniform(2, 8, n)
+        v_xs = _DIR_COS[directions] * speeds
+        v_ys = _DIR_SIN[directions] * speeds
+
+        # Particle properties vary by type
+        if self.particle_type == "heart":
+            sizes = _integers(25, 40, n, endpoint=True)  # Larger hearts
+            life_times = _integers(30, 60, n, endpoint=True)  # Longer life
+        else:  # pixel particles
+            sizes = _integers(PIXEL_SIZES.start, PIXEL_SIZES.stop, n)  # Smaller pixels
+            life_times = _integers(20, 40, n, endpoint=True)  # Shorter life
+
+        # Color variation: one of the firework color's fixed variants per particle
+        colors = color_variants(self.color)[_integers(0, COLOR_VARIANTS, n)]
+
+        if self.particle_store is not None:
+            kind = HEART if self.particle_type == "heart" else PIXEL
+            self.particle_store.spawn_batch(self.x, self.y, v_xs, v_ys, colors.tolist(),
+                                            sizes.tolist(), life_times, kind)
 
     def draw(self, screen):
         """
-        Render the firework in its current state.
+        Render the rocket with its fading trail.
         
-        Launch phase: Draws projectile with fading trail.
-        Explosion phase: Draws all active particles.
+        Only called while launching: FireworkManager drops a firework in the
+        same update that explodes it. Explosion particles are drawn by the
+        ParticleSystem.
         
         Args:
             screen (pygame.Surface): Surface to draw on
+        
+        Returns:
+            list: pygame.Rect areas that were drawn this frame
         """
-        if not self.exploded:
-            # Draw the ascending projectile
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 3)
-            
-            # Draw motion trail behind projectile
-            for i in range(5):
-                trail_x = int(self.x - self.v_x * i * 2)
-                trail_y = int(self.y - self.v_y * i * 2)
-                # Fade trail progressively
-                alpha = 1 - (i * 0.2)
-                trail_color = (
-                    int(self.color[0] * alpha),
-                    int(self.color[1] * alpha),
-                    int(self.color[2] * alpha)
-                )
-                # Shrink trail circles progressively
-                pygame.draw.circle(screen, trail_color, (trail_x, trail_y), max(1, 3 - i))
-        else:
-            # Draw all explosion particles
-            for particle in self.particles:
-                particle.draw(screen)
\ No newline at end of file
+        # Projectile and trail in one blit of the pre-rendered sprite
+        position = (int(self.x) + self._sprite_offset[0], int(self.y) + self._sprite_offset[1])
+        return [screen.blit(self._sprite, position)]
\ No newline at end of file
@@ -10,47 +10,76 @@ Classes:
 import pygame
 from config import WIDTH, HEIGHT, WHITE
 
+# Control help shown at the top-left
+INSTRUCTIONS = [
+    "SPACE: Heart fireworks",
+    "P: Pixel fireworks",
+    "K+G: Romance combo (hearts!)",
+]
+
 class Renderer:
     """
     Handles rendering of all game elements to the screen.
     """
     def __init__(self, screen):
         self.screen = screen
+        # Areas drawn last frame must be pushed again so they get erased;
+        # seeding with the whole screen makes the first frame a full update
+        self._prev_dirty = [screen.get_rect()]
+
+        # Background and ground line are static, so render them once
+        self._background = pygame.Surface((WIDTH, HEIGHT))
+        self._background.fill((30, 30, 30))
+        pygame.draw.line(self._background, WHITE, [0, HEIGHT // 2 + 32], [WIDTH, HEIGHT // 2 + 32], 10)
+        self._background = self._background.convert()
+
+        # Instruction text never changes, so load the font and render it once
+        self._font = pygame.font.Font(None, 24)
+        self._instruction_blits = [
+            (self._font.render(instruction, True, WHITE), (10, 10 + i * 25))
+            for i, instruction in enumerate(INSTRUCTIONS)
+        ]
 
-    def draw_frame(self, kwimi, grogu, fireworks):
+    def invalidate(self):
+        """
+        Push the whole screen on the next frame.
+        
+        Call when the window contents may have been lost (exposed, restored),
+        since static areas are otherwise never pushed again after the first frame.
+        """
+        self._prev_dirty = [self.screen.get_rect()]
+
+    def draw_frame(self, kwimi, grogu, firework_manager):
         """
         Draw a complete frame including background, characters, and effects.
         
         Args:
             kwimi: Character instance for Kwimi
             grogu: Character instance for Grogu
-            fireworks: List of active Firework instances
+            firework_manager: FireworkManager holding rockets and particles
+        
+        Returns:
+            list: pygame.Rect areas to pass to pygame.display.update()
         """
-        self.screen.fill((30, 30, 30))
-
-        # Draw ground line
-        pygame.draw.line(self.screen, WHITE, [0, HEIGHT // 2 + 32], [WIDTH, HEIGHT // 2 + 32], 10)
+        # Background and ground line in one copy
+        self.screen.blit(self._background, (0, 0))
 
         # Draw characters
-        kwimi.draw(self.screen)
-        grogu.draw(self.screen)
+        dirty = kwimi.draw(self.screen)
+        dirty.extend(grogu.draw(self.screen))
 
-        # Draw fireworks
-        for firework in fireworks:
-            firework.draw(self.screen)
+        # Draw firework rockets, then the explosion particles
+        for firework in firework_manager.get_fireworks():
+            dirty.extend(firework.draw(self.screen))
+        dirty.extend(firework_manager.particles.draw(self.screen))
 
-        # Draw instructions
+        # Draw instructions (static, covered by the first full update)
         self._draw_instructions()
 
+        update_rects = self._prev_dirty + dirty
+        self._prev_dirty = dirty
+        return update_rects
+
     def _draw_instructions(self):
-        """Draw control instructions at the top-left."""
-        instruction_font = pygame.font.Font(None, 24)
-        instructions = [
-            "SPACE: Heart fireworks",
-            "P: Pixel fireworks", 
-            "K+G: Romance combo (hearts!)",
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            surface = instruction_font.render(instruction, True, WHITE)
-            self.screen.blit(surface, (10, 10 + i * 25))
\ No newline at end of file
+        """Draw the pre-rendered control instructions at the top-left."""
+        self.screen.blits(self._instruction_blits, doreturn=False)
@@ -9,17 +9,37 @@ Functions:
     load_image: Load and transform images with error handling
     ease_out_bounce: Bounce easing function for natural motion
     ease_out_elastic: Elastic easing for springy effects
+    njit: numba.njit, or a no-op stand-in when Numba is not installed
+
+Objects:
+    rng: NumPy random Generator shared by all random game effects
 
 Easing Functions:
     Mathematical functions that map linear time progression (0.0 to 1.0)
     to non-linear motion curves, creating more natural-looking animations.
     
     Reference: https://easings.net/
+
+    ease_out_bounce is compiled with Numba when it is installed; without
+    Numba every function here runs as plain Python.
 """
 import pygame
 import math
+import numpy as np
 from config import RED, GREEN
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# One generator for the whole game instead of one per subsystem
+rng = np.random.default_rng()
+
 
 def load_image(filename, size=None, flip=None):
     """
@@ -57,6 +77,7 @@ def load_image(filename, size=None, flip=None):
         return placeholder
 
 
+@njit('float64(float64)', cache=True, fastmath=True)
 def ease_out_bounce(t):
     """
     Bounce easing function for smooth, natural bounce motion.